@@ -45,9 +45,53 @@ class ArgumentDefaultsHelpMultilineFormatter(MultilineFormatter, argparse.Argume
 default_string = '  The default value is "%(default)s".'
 module = sys.modules["__main__"]
 
+# The add_argument keyword arguments for each stock parm supported by gen_get_options.  These are built once
+# at import time rather than on every call.
+stock_parm_kwargs = {
+    "quiet": dict(
+        default=0,
+        type=int,
+        choices=[1, 0],
+        help='If this parameter is set to "1", %(prog)s'
+             + ' will print only essential information, i.e. it will'
+             + ' not echo parameters, echo commands, print the total'
+             + ' run time, etc.' + default_string),
+    "test_mode": dict(
+        default=0,
+        type=int,
+        choices=[1, 0],
+        help='This means that %(prog)s should go through all the'
+             + ' motions but not actually do anything substantial.'
+             + '  This is mainly to be used by the developer of'
+             + ' %(prog)s.' + default_string),
+    "debug": dict(
+        default=0,
+        type=int,
+        choices=[1, 0],
+        help='If this parameter is set to "1", %(prog)s will print'
+             + ' additional debug information.  This is mainly to be'
+             + ' used by the developer of %(prog)s.' + default_string),
+    "loglevel": dict(
+        default="info",
+        type=str,
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL',
+                 'debug', 'info', 'warning', 'error', 'critical'],
+        help='If this parameter is set to "1", %(prog)s will print'
+             + ' additional debug information.  This is mainly to be'
+             + ' used by the developer of %(prog)s.' + default_string),
+}
+
+# The __builtin__ values set by gen_get_options for stock parms which the caller did not request.
+stock_builtin_defaults = {
+    "quiet": 0,
+    "test_mode": 0,
+    "debug": 0,
+    "loglevel": 'WARNING',
+}
+
 
 def gen_get_options(parser,
-                    stock_list=[]):
+                    stock_list=None):
     r"""
     Parse the command line arguments using the parser object passed and return True/False (i.e. pass/fail).
     However, if gv.exit_on_error is set, simply exit the program on failure.  Also set the following built in
@@ -65,114 +109,51 @@ def gen_get_options(parser,
                                     offered by this function.  For example, this function will define a
                                     "quiet" option upon request.  This includes stop help text and parm
                                     checking.  The stock_list is a list of tuples each of which consists of
-                                    an arg_name and a default value.  Example: stock_list = [("test_mode",
-                                    0), ("quiet", 1), ("debug", 0)]
+                                    an arg_name and an optional default value.  Example: stock_list =
+                                    [("test_mode", 0), ("quiet", 1), ("debug",)]
     """
 
-    # This is a list of stock parms that we support.
-    master_stock_list = ["quiet", "test_mode", "debug", "loglevel"]
-
     # Process stock_list.
-    for ix in range(0, len(stock_list)):
-        if len(stock_list[ix]) < 1:
-            error_message = "Programmer error - stock_list[" + str(ix) +\
-                            "] is supposed to be a tuple containing at" +\
-                            " least one element which is the name of" +\
-                            " the desired stock parameter:\n" +\
-                            gp.sprint_var(stock_list)
-            return gv.process_error_message(error_message)
-        if isinstance(stock_list[ix], tuple):
-            arg_name = stock_list[ix][0]
-            default = stock_list[ix][1]
+    stock_parm_names = []
+    for ix, stock_parm in enumerate(stock_list or []):
+        if isinstance(stock_parm, tuple):
+            if not stock_parm:
+                error_message = "Programmer error - stock_list[%d] is supposed to be a tuple containing at" \
+                                " least one element which is the name of the desired stock parameter:\n%s" \
+                                % (ix, gp.sprint_var(stock_list))
+                return gv.process_error_message(error_message)
+            arg_name = stock_parm[0]
+            default = stock_parm[1] if len(stock_parm) > 1 else None
         else:
-            arg_name = stock_list[ix]
+            arg_name = stock_parm
             default = None
 
-        if arg_name not in master_stock_list:
-            error_message = "Programmer error - arg_name \"" + arg_name +\
-                            "\" not found found in stock list:\n" +\
-                            gp.sprint_var(master_stock_list)
+        # The keys of stock_parm_kwargs are the stock parms that we support.
+        if arg_name not in stock_parm_kwargs:
+            error_message = "Programmer error - arg_name \"%s\" not found found in stock list:\n%s" \
+                            % (arg_name, gp.sprint_varx("master_stock_list", list(stock_parm_kwargs)))
             return gv.process_error_message(error_message)
 
-        if arg_name == "quiet":
-            if default is None:
-                default = 0
-            parser.add_argument(
-                '--quiet',
-                default=default,
-                type=int,
-                choices=[1, 0],
-                help='If this parameter is set to "1", %(prog)s'
-                     + ' will print only essential information, i.e. it will'
-                     + ' not echo parameters, echo commands, print the total'
-                     + ' run time, etc.' + default_string)
-        elif arg_name == "test_mode":
-            if default is None:
-                default = 0
-            parser.add_argument(
-                '--test_mode',
-                default=default,
-                type=int,
-                choices=[1, 0],
-                help='This means that %(prog)s should go through all the'
-                     + ' motions but not actually do anything substantial.'
-                     + '  This is mainly to be used by the developer of'
-                     + ' %(prog)s.' + default_string)
-        elif arg_name == "debug":
-            if default is None:
-                default = 0
-            parser.add_argument(
-                '--debug',
-                default=default,
-                type=int,
-                choices=[1, 0],
-                help='If this parameter is set to "1", %(prog)s will print'
-                     + ' additional debug information.  This is mainly to be'
-                     + ' used by the developer of %(prog)s.' + default_string)
-        elif arg_name == "loglevel":
-            if default is None:
-                default = "info"
-            parser.add_argument(
-                '--loglevel',
-                default=default,
-                type=str,
-                choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL',
-                         'debug', 'info', 'warning', 'error', 'critical'],
-                help='If this parameter is set to "1", %(prog)s will print'
-                     + ' additional debug information.  This is mainly to be'
-                     + ' used by the developer of %(prog)s.' + default_string)
+        kwargs = dict(stock_parm_kwargs[arg_name])
+        if default is not None:
+            kwargs['default'] = default
+        parser.add_argument('--' + arg_name, **kwargs)
+        stock_parm_names.append(arg_name)
 
     arg_obj = parser.parse_args()
 
-    __builtin__.quiet = 0
-    __builtin__.test_mode = 0
-    __builtin__.debug = 0
-    __builtin__.loglevel = 'WARNING'
-    for ix in range(0, len(stock_list)):
-        if isinstance(stock_list[ix], tuple):
-            arg_name = stock_list[ix][0]
-            default = stock_list[ix][1]
-        else:
-            arg_name = stock_list[ix]
-            default = None
-        if arg_name == "quiet":
-            __builtin__.quiet = arg_obj.quiet
-        elif arg_name == "test_mode":
-            __builtin__.test_mode = arg_obj.test_mode
-        elif arg_name == "debug":
-            __builtin__.debug = arg_obj.debug
-        elif arg_name == "loglevel":
-            __builtin__.loglevel = arg_obj.loglevel
-
-    __builtin__.arg_obj = arg_obj
-    __builtin__.parser = parser
+    builtin_dict = vars(__builtin__)
+    builtin_dict.update(stock_builtin_defaults)
+    for arg_name in stock_parm_names:
+        builtin_dict[arg_name] = arg_obj.__dict__[arg_name]
+
+    builtin_dict['arg_obj'] = arg_obj
+    builtin_dict['parser'] = parser
 
     # For each command line parameter, create a corresponding global variable and assign it the appropriate
     # value.  For example, if the command line contained "--last_name='Smith', we'll create a global variable
     # named "last_name" with the value "Smith".
-    module = sys.modules['__main__']
-    for key in arg_obj.__dict__:
-        setattr(module, key, getattr(__builtin__.arg_obj, key))
+    sys.modules['__main__'].__dict__.update(arg_obj.__dict__)
 
     return True
 
@@ -195,12 +176,8 @@ def set_pgm_arg(var_value,
     arg_obj.__dict__[var_name] = var_value
     module = sys.modules['__main__']
     setattr(module, var_name, var_value)
-    if var_name == "quiet":
-        __builtin__.quiet = var_value
-    elif var_name == "debug":
-        __builtin__.debug = var_value
-    elif var_name == "test_mode":
-        __builtin__.test_mode = var_value
+    if var_name in stock_parm_kwargs:
+        setattr(__builtin__, var_name, var_value)
 
 
 def sprint_args(arg_obj,
@@ -215,12 +192,10 @@ def sprint_args(arg_obj,
     """
 
     col1_width = gp.dft_col1_width + indent
+    sprint_varx = gp.sprint_varx
 
-    buffer = ""
-    for key in arg_obj.__dict__:
-        buffer += gp.sprint_varx(key, getattr(arg_obj, key), 0, indent,
-                                 col1_width)
-    return buffer
+    return "".join([sprint_varx(key, value, 0, indent, col1_width)
+                    for key, value in arg_obj.__dict__.items()])
 
 
 def sync_args():
@@ -470,6 +445,10 @@ def gen_exit_function():
     gp.qprint_pgm_footer()
 
 
+# The signals caught by the signal_handler registered in gen_post_validation.
+handled_signals = (signal.SIGINT, signal.SIGTERM)
+
+
 def gen_signal_handler(signal_number,
                        frame):
     r"""
@@ -507,8 +486,8 @@ def gen_post_validation(exit_function=None,
     signal_handler = signal_handler or gen_signal_handler
 
     atexit.register(exit_function)
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    for signal_number in handled_signals:
+        signal.signal(signal_number, signal_handler)
 
 
 def gen_setup():